@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 
 # 모듈화된 컴포넌트 임포트
 from scheduler import setup_scheduler, simulate_scheduler_at_time
-from notion_utils import query_notion_database, REFERENCE_DB_ID
+from notion_utils import query_notion_database, close_notion_client, REFERENCE_DB_ID
 
 app = FastAPI(title="YouTube Script Extractor with Notion Integration")
 
@@ -106,6 +106,12 @@ async def startup_event():
     setup_scheduler()
     logger.info("Application started with scheduler configured")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """애플리케이션 종료 시 Notion 클라이언트 연결 정리"""
+    await close_notion_client()
+    logger.info("Notion client closed")
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8001, reload=True)
\ No newline at end of file
@@ -33,28 +33,28 @@ def parse_formatting(text: str) -> List[Dict[str, Any]]:
     return result if result else [{"type": "text", "text": {"content": text}}]
 
 
+def _paragraph_block(rich_text: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """리치 텍스트로 Notion 단락 블록을 만듭니다."""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": rich_text}
+    }
+
+
 def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
     """마크다운 텍스트를 Notion 블록으로 변환합니다."""
     blocks = []
     lines = content.split('\n')
-    i = 0
     current_text = ""
     MAX_TEXT_LENGTH = 1900  # Notion API 제한보다 안전하게 설정
     
-    while i < len(lines):
-        line = lines[i]
-        
+    for i, line in enumerate(lines):
         # 제목 처리 (# 시작)
         if line.startswith('# '):
             # 기존 텍스트 처리
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 새 제목 블록
@@ -70,13 +70,7 @@ def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
         elif line.startswith('## '):
             # 기존 텍스트 처리
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 새 부제목 블록
@@ -92,13 +86,7 @@ def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
         elif line.startswith('### '):
             # 기존 텍스트 처리
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 새 소제목 블록
@@ -114,13 +102,7 @@ def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
         elif line.strip() == '---':
             # 기존 텍스트 처리
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 구분선 블록
@@ -134,13 +116,7 @@ def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
         elif (line.strip().startswith('- ') or line.strip().startswith('* ')) and not line.strip().startswith('- [ ]') and not line.strip().startswith('- [x]'):
             # 기존 텍스트 처리
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 불릿 포인트 내용 추출
@@ -162,51 +138,28 @@ def create_markdown_blocks(content: str) -> List[Dict[str, Any]]:
         elif not line.strip():
             # 이전 텍스트가 있을 경우 블록 추가
             if current_text.strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text.strip())
-                    }
-                })
+                blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
                 current_text = ""
             
             # 빈 줄이 여러 개 연속되면 하나의 빈 단락만 추가
             if i + 1 < len(lines) and lines[i + 1].strip():
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": []
-                    }
-                })
+                blocks.append(_paragraph_block([]))
             
         # 일반 텍스트 행
         else:
             current_text += line + "\n"
             
-            # 텍스트가 너무 길어지면 분할
-            if len(current_text) > MAX_TEXT_LENGTH:
-                blocks.append({
-                    "object": "block",
-                    "type": "paragraph",
-                    "paragraph": {
-                        "rich_text": parse_formatting(current_text[:MAX_TEXT_LENGTH].strip())
-                    }
-                })
-                current_text = current_text[MAX_TEXT_LENGTH:]
-        
-        i += 1
+            # 텍스트가 너무 길어지면 MAX_TEXT_LENGTH 단위로 분할하고 나머지만 남김
+            text_length = len(current_text)
+            if text_length > MAX_TEXT_LENGTH:
+                split_end = text_length - text_length % MAX_TEXT_LENGTH
+                for start in range(0, split_end, MAX_TEXT_LENGTH):
+                    blocks.append(_paragraph_block(parse_formatting(current_text[start:start + MAX_TEXT_LENGTH].strip())))
+                current_text = current_text[split_end:]
     
     # 마지막 남은 텍스트 처리
     if current_text.strip():
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {
-                "rich_text": parse_formatting(current_text.strip())
-            }
-        })
+        blocks.append(_paragraph_block(parse_formatting(current_text.strip())))
     
     return blocks
 
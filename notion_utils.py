@@ -1,11 +1,20 @@
 import os
-import json
 import logging
 import httpx
-from typing import Dict, List, Any, Optional
+import orjson
+from aiolimiter import AsyncLimiter
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import asyncio
+import time
 from dotenv import load_dotenv
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from notion_markdown import create_markdown_blocks
 
 # 환경 변수 로드
@@ -18,64 +27,173 @@ SCRIPT_DB_ID = os.getenv("SCRIPT_DB_ID")
 
 logger = logging.getLogger(__name__)
 
-async def query_notion_database(database_id: str, request_body: dict = None, max_retries: int = 3, timeout: float = 30.0) -> List[Dict[str, Any]]:
+# 모든 Notion API 요청에 공통으로 사용하는 헤더
+_HEADERS = {
+    "Authorization": f"Bearer {NOTION_API_KEY}",
+    "Notion-Version": "2022-06-28",
+    "Content-Type": "application/json"
+}
+
+# check_script_exists 결과 캐시: {영상 URL: (조회 시각, 존재 여부)}
+# 조회 실패가 "없음"으로 남지 않도록 존재하는 경우만 기록
+_EXISTS_CACHE_TTL = 300  # 5분
+_exists_cache: Dict[str, Tuple[float, bool]] = {}
+
+# 연결 재사용을 위한 공용 클라이언트 (최초 요청 시 생성)
+_client: Optional[httpx.AsyncClient] = None
+
+# Notion API 요청 제한(초당 평균 3회)에 맞춰 요청 전에 미리 속도를 조절
+# 이벤트 루프에 묶이므로 클라이언트와 함께 생성
+_limiter: Optional[AsyncLimiter] = None
+
+async def _get_client() -> httpx.AsyncClient:
+    """Notion API용 공용 AsyncClient를 반환합니다. 없거나 닫혀 있으면 새로 생성합니다."""
+    global _client, _limiter
+    
+    if _client is None or _client.is_closed:
+        _limiter = AsyncLimiter(max_rate=3, time_period=1)
+        _client = httpx.AsyncClient(
+            base_url="https://api.notion.com",
+            headers=_HEADERS,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+    
+    return _client
+
+async def close_notion_client() -> None:
+    """공용 클라이언트를 닫습니다. 애플리케이션 종료 시 호출합니다."""
+    global _client
+    
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+class RateLimited(Exception):
+    """Notion API가 429 (Rate Limit)를 반환했을 때 발생합니다."""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(f"Rate limited. Retry after {retry_after}s")
+        self.retry_after = retry_after
+
+class NotionAPIError(Exception):
+    """Notion API가 200/429 이외의 상태 코드를 반환했을 때 발생합니다."""
+    
+    def __init__(self, status_code: int, content: bytes):
+        super().__init__(f"Notion API error {status_code}")
+        self.status_code = status_code
+        self.content = content
+
+class NotionServerError(NotionAPIError):
+    """Notion API가 5xx를 반환했을 때 발생합니다. 일시적인 오류로 보고 재시도합니다."""
+
+def _parse_response(response: httpx.Response) -> Dict[str, Any]:
     """
-    Notion 데이터베이스를 쿼리합니다. 재시도 및 타임아웃 처리가 포함되어 있습니다.
+    응답 상태 코드를 확인하고 JSON 본문을 반환합니다.
+    429 응답은 RateLimited로, 5xx 응답은 NotionServerError로,
+    그 외 오류 응답은 NotionAPIError로 변환합니다.
     """
-    url = f"https://api.notion.com/v1/databases/{database_id}/query"
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
+    status_code = response.status_code
+    if status_code == 200:
+        return orjson.loads(response.content)
+    if status_code == 429:
+        raise RateLimited(int(response.headers.get("Retry-After", 5)))
+    if status_code >= 500:
+        raise NotionServerError(status_code, response.content)
+    raise NotionAPIError(status_code, response.content)
+
+# 재시도 대상: 타임아웃/연결 오류, 429 응답, 5xx 응답
+_retryable = retry_if_exception_type((httpx.TransportError, RateLimited, NotionServerError))
+_backoff = wait_random_exponential(min=1, max=30)
+
+def _wait_before_retry(retry_state: RetryCallState) -> float:
+    """429이면 Retry-After 만큼, 그 외에는 지터가 포함된 지수 백오프만큼 대기합니다."""
+    error = retry_state.outcome.exception()
+    if isinstance(error, RateLimited):
+        return error.retry_after
+    return _backoff(retry_state)
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    logger.warning(f"Notion API request failed: {retry_state.outcome.exception()!r}. "
+                   f"Retrying in {retry_state.next_action.sleep:.1f}s")
+
+async def _request(method: str, url: str, body: bytes, description: str, max_retries: int = 3, timeout: float = 30.0, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Notion API 요청을 보내고 응답 JSON을 반환합니다.
+    타임아웃/연결 오류, 429 응답, 5xx 응답은 최대 max_retries회까지 재시도하며,
+    그 외 오류 응답은 NotionAPIError로 전달됩니다.
+    """
+    client = await _get_client()
     
-    if request_body is None:
-        request_body = {}
+    async for attempt in AsyncRetrying(
+        wait=_wait_before_retry,
+        stop=stop_after_attempt(max_retries),
+        retry=_retryable,
+        before_sleep=_log_retry,
+        reraise=True
+    ):
+        with attempt:
+            logger.info(f"{description} (attempt {attempt.retry_state.attempt_number}/{max_retries})")
+            request = client.build_request(method, url, content=body, params=params, timeout=timeout)
+            async with _limiter:
+                response = await client.send(request)
+            
+            return _parse_response(response)
+
+def _log_http_error(e: NotionAPIError) -> None:
+    """Notion API 오류 응답의 상세 내용을 로깅합니다."""
+    logger.error(f"HTTP error: {e.status_code} - {e.content.decode('utf-8', 'replace')}")
     
-    # 재시도 로직
-    for attempt in range(max_retries):
-        try:
-            async with httpx.AsyncClient() as client:
-                logger.info(f"Querying Notion database (attempt {attempt+1}/{max_retries})")
-                response = await client.post(
-                    url, 
-                    headers=headers, 
-                    json=request_body, 
-                    timeout=timeout
-                )
-                
-                response.raise_for_status()
-                results = response.json().get("results", [])
-                logger.info(f"Successfully retrieved {len(results)} records from Notion database")
-                return results
-                
-        except httpx.TimeoutException:
-            logger.warning(f"Timeout when querying Notion database (attempt {attempt+1}/{max_retries})")
-            if attempt < max_retries - 1:
-                # 재시도 전 잠시 대기 (지수 백오프)
-                await asyncio.sleep(2 ** attempt)
-            else:
-                logger.error(f"Max retries reached when querying Notion database {database_id}")
-                return []
-                
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            # 429 (Rate Limit) 오류인 경우 더 오래 대기
-            if e.response.status_code == 429 and attempt < max_retries - 1:
-                retry_after = int(e.response.headers.get("Retry-After", 5))
-                logger.warning(f"Rate limited. Waiting for {retry_after}s before retry")
-                await asyncio.sleep(retry_after)
-            else:
-                return []
-                
-        except Exception as e:
-            logger.error(f"Error querying Notion database: {str(e)}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-            else:
-                return []
+    try:
+        error_json = orjson.loads(e.content)
+        if "message" in error_json:
+            logger.error(f"API 오류 메시지: {error_json['message']}")
+        if "code" in error_json:
+            logger.error(f"API 오류 코드: {error_json['code']}")
+    except orjson.JSONDecodeError:
+        pass
+
+async def iter_notion_database(database_id: str, request_body: dict = None, max_retries: int = 3, timeout: float = 30.0, filter_properties: Optional[List[str]] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Notion 데이터베이스를 쿼리하여 페이지를 하나씩 반환합니다.
+    한 번에 최대 100개씩 반환되는 결과를 next_cursor로 끝까지 이어서 가져옵니다.
+    filter_properties에 속성 ID 목록을 주면 응답에 해당 속성 값만 포함됩니다.
+    재시도 후에도 요청이 실패하면 예외를 그대로 전달합니다 (중간 페이지 실패 포함).
+    """
+    url = f"/v1/databases/{database_id}/query"
+    body = dict(request_body) if request_body else {}
+    params = {"filter_properties": filter_properties} if filter_properties is not None else None
     
-    return []
+    while True:
+        data = await _request("POST", url, orjson.dumps(body), "Querying Notion database", max_retries, timeout, params)
+        
+        results = data.get("results", [])
+        logger.info(f"Successfully retrieved {len(results)} records from Notion database")
+        for page in results:
+            yield page
+        
+        if not data.get("has_more") or not data.get("next_cursor"):
+            return
+        body["start_cursor"] = data["next_cursor"]
+
+def _log_query_error(database_id: str, e: Exception) -> None:
+    """데이터베이스 쿼리 실패를 로깅합니다."""
+    if isinstance(e, NotionAPIError):
+        _log_http_error(e)
+    else:
+        logger.error(f"Error querying Notion database {database_id}: {str(e)}")
+
+async def query_notion_database(database_id: str, request_body: dict = None, max_retries: int = 3, timeout: float = 30.0, filter_properties: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Notion 데이터베이스를 쿼리합니다. 재시도 및 타임아웃 처리가 포함되어 있습니다.
+    100개를 넘는 결과도 모두 가져와 리스트로 반환하며,
+    어느 페이지에서든 실패하면 일부 결과 대신 빈 리스트를 반환합니다.
+    """
+    try:
+        return [page async for page in iter_notion_database(database_id, request_body, max_retries, timeout, filter_properties)]
+    except Exception as e:
+        _log_query_error(database_id, e)
+        return []
 
 
 async def create_script_report_page(database_id: str, properties: Dict[str, Any], content: str, max_retries: int = 3, timeout: float = 120.0) -> Optional[Dict[str, Any]]:
@@ -83,254 +201,182 @@ async def create_script_report_page(database_id: str, properties: Dict[str, Any]
     Notion에 새 페이지를 생성합니다. 마크다운 형식의 콘텐츠를 적절한 Notion 블록으로 변환합니다.
     재시도 및 타임아웃 처리가 포함되어 있습니다.
     """
-    url = "https://api.notion.com/v1/pages"
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
+    url = "/v1/pages"
     
     # 페이지 내용 설정 - 개선된 마크다운 처리 사용
-    data = {
-        "parent": {"database_id": database_id},
-        "properties": properties,
-        "children": create_markdown_blocks(content)
-    }
+    blocks = create_markdown_blocks(content)
+    total_blocks = len(blocks)
     
     # Notion API는 한 번에 100개의 블록까지만 허용
     # 블록이 100개 이상이면 나눠서 요청
     MAX_BLOCKS_PER_REQUEST = 90  # 안전하게 90개로 제한
     
-    if len(data["children"]) > MAX_BLOCKS_PER_REQUEST:
-        logger.info(f"블록이 너무 많아 여러 요청으로 나누어 처리합니다. 총 {len(data['children'])}개 블록")
+    if total_blocks > MAX_BLOCKS_PER_REQUEST:
+        logger.info(f"블록이 너무 많아 여러 요청으로 나누어 처리합니다. 총 {total_blocks}개 블록")
         
         # 첫 번째 요청: 속성과 첫 90개 블록
         first_request_data = {
-            "parent": data["parent"],
-            "properties": data["properties"],
-            "children": data["children"][:MAX_BLOCKS_PER_REQUEST]
+            "parent": {"database_id": database_id},
+            "properties": properties,
+            "children": blocks[:MAX_BLOCKS_PER_REQUEST]
         }
         
         # 첫 번째 페이지 생성
-        page_response = None
-        for attempt in range(max_retries):
-            try:
-                async with httpx.AsyncClient() as client:
-                    logger.info(f"Creating Notion page - first part (attempt {attempt+1}/{max_retries})")
-                    response = await client.post(
-                        url, 
-                        headers=headers, 
-                        json=first_request_data,
-                        timeout=timeout
-                    )
-                    
-                    response.raise_for_status()
-                    page_response = response.json()
-                    logger.info(f"First part created successfully")
-                    break
-                    
-            except Exception as e:
-                logger.error(f"Error creating first part: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    return None
-        
-        if not page_response:
+        try:
+            page_response = await _request(
+                "POST", url, orjson.dumps(first_request_data),
+                "Creating Notion page - first part", max_retries, timeout
+            )
+            logger.info(f"First part created successfully")
+        except NotionAPIError as e:
+            _log_http_error(e)
+            return None
+        except Exception as e:
+            logger.error(f"Error creating first part: {str(e)}")
             return None
             
-        # 남은 블록을 90개씩 나눠 추가 요청
+        # 남은 블록을 90개씩 나눠 추가 요청 (blocks에서 바로 잘라 전송)
+        # Notion은 도착 순서대로 블록을 덧붙이므로 순서 보장을 위해 순차 요청
+        # 고정 딜레이 없이 429 응답이 올 때만 Retry-After 만큼 대기
         page_id = page_response["id"]
-        remaining_blocks = data["children"][MAX_BLOCKS_PER_REQUEST:]
+        append_url = f"/v1/blocks/{page_id}/children"
         
-        for i in range(0, len(remaining_blocks), MAX_BLOCKS_PER_REQUEST):
-            append_blocks = remaining_blocks[i:i + MAX_BLOCKS_PER_REQUEST]
-            
-            # 블록 추가 요청
-            append_url = f"https://api.notion.com/v1/blocks/{page_id}/children"
-            append_data = {"children": append_blocks}
-            
-            success = False
-            for attempt in range(max_retries):
-                try:
-                    async with httpx.AsyncClient() as client:
-                        logger.info(f"Appending blocks part {i//MAX_BLOCKS_PER_REQUEST + 2} (attempt {attempt+1}/{max_retries})")
-                        response = await client.patch(
-                            append_url, 
-                            headers=headers, 
-                            json=append_data,
-                            timeout=timeout
-                        )
-                        
-                        response.raise_for_status()
-                        logger.info(f"Part {i//MAX_BLOCKS_PER_REQUEST + 2} appended successfully")
-                        success = True
-                        # API 제한 준수를 위한 딜레이
-                        await asyncio.sleep(0.5)  # 0.5초 대기
-                        break
-                        
-                except Exception as e:
-                    logger.error(f"Error appending part {i//MAX_BLOCKS_PER_REQUEST + 2}: {str(e)}")
-                    if attempt < max_retries - 1:
-                        await asyncio.sleep(2 ** attempt)
-                    else:
-                        # 실패해도 계속 진행, 일부 콘텐츠라도 저장
-                        logger.warning(f"Failed to append part {i//MAX_BLOCKS_PER_REQUEST + 2}, but continuing")
+        for start in range(MAX_BLOCKS_PER_REQUEST, total_blocks, MAX_BLOCKS_PER_REQUEST):
+            part = start // MAX_BLOCKS_PER_REQUEST + 1
+            append_data = {"children": blocks[start:start + MAX_BLOCKS_PER_REQUEST]}
             
-            if not success:
+            try:
+                await _request(
+                    "PATCH", append_url, orjson.dumps(append_data),
+                    f"Appending blocks part {part}", max_retries, timeout
+                )
+                logger.info(f"Part {part} appended successfully")
+            except Exception as e:
+                # 실패해도 계속 진행, 일부 콘텐츠라도 저장
+                logger.error(f"Error appending part {part}: {str(e)}")
                 logger.warning(f"Could not append all blocks to page")
                 
+        _remember_script_url(properties)
         return page_response
     
     # 블록이 적은 경우 단일 요청으로 처리
     else:
-        # 재시도 로직
-        for attempt in range(max_retries):
-            try:
-                async with httpx.AsyncClient() as client:
-                    logger.info(f"Creating Notion page (attempt {attempt+1}/{max_retries})")
-                    response = await client.post(
-                        url, 
-                        headers=headers, 
-                        json=data,
-                        timeout=timeout
-                    )
-                    
-                    # 디버깅을 위한 상세 오류 로깅
-                    if response.status_code != 200:
-                        logger.error(f"Notion API 오류: {response.status_code}")
-                        logger.error(f"응답 내용: {response.text}")
-                        
-                        # 오류 내용 상세 분석
-                        try:
-                            error_json = response.json()
-                            if "message" in error_json:
-                                logger.error(f"API 오류 메시지: {error_json['message']}")
-                            if "code" in error_json:
-                                logger.error(f"API 오류 코드: {error_json['code']}")
-                        except:
-                            pass
-                    
-                    response.raise_for_status()
-                    logger.info(f"Successfully created Notion page")
-                    return response.json()
-                    
-            except httpx.TimeoutException:
-                logger.warning(f"Timeout when creating Notion page (attempt {attempt+1}/{max_retries})")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    logger.error("Max retries reached when creating Notion page")
-                    return None
-                    
-            except httpx.HTTPStatusError as e:
-                logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-                # 429 (Rate Limit) 오류인 경우 더 오래 대기
-                if e.response.status_code == 429 and attempt < max_retries - 1:
-                    retry_after = int(e.response.headers.get("Retry-After", 5))
-                    logger.warning(f"Rate limited. Waiting for {retry_after}s before retry")
-                    await asyncio.sleep(retry_after)
-                else:
-                    return None
-                    
-            except Exception as e:
-                logger.error(f"Error creating Notion page: {str(e)}")
-                if attempt < max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
-                else:
-                    logger.error("Max retries reached")
-                    return None
+        data = {
+            "parent": {"database_id": database_id},
+            "properties": properties,
+            "children": blocks
+        }
+        
+        try:
+            page_response = await _request("POST", url, orjson.dumps(data), "Creating Notion page", max_retries, timeout)
+        except NotionAPIError as e:
+            _log_http_error(e)
+            return None
+        except Exception as e:
+            logger.error(f"Error creating Notion page: {str(e)}")
+            return None
         
-        return None
+        logger.info(f"Successfully created Notion page")
+        _remember_script_url(properties)
+        return page_response
         
 async def update_notion_page(page_id: str, properties: Dict[str, Any], max_retries: int = 3, timeout: float = 30.0) -> bool:
     """
     Notion 페이지의 속성을 업데이트합니다.
     재시도 및 타임아웃 처리가 포함되어 있습니다.
     """
-    url = f"https://api.notion.com/v1/pages/{page_id}"
-    headers = {
-        "Authorization": f"Bearer {NOTION_API_KEY}",
-        "Notion-Version": "2022-06-28",
-        "Content-Type": "application/json"
-    }
+    url = f"/v1/pages/{page_id}"
     
     data = {
         "properties": properties
     }
     
-    # 재시도 로직
-    for attempt in range(max_retries):
-        try:
-            async with httpx.AsyncClient() as client:
-                logger.info(f"Updating Notion page (attempt {attempt+1}/{max_retries})")
-                response = await client.patch(
-                    url, 
-                    headers=headers, 
-                    json=data,
-                    timeout=timeout
-                )
-                
-                response.raise_for_status()
-                logger.info(f"Successfully updated Notion page")
-                return True
-                
-        except httpx.TimeoutException:
-            logger.warning(f"Timeout when updating Notion page (attempt {attempt+1}/{max_retries})")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-            else:
-                logger.error("Max retries reached when updating Notion page")
-                return False
-                
-        except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error: {e.response.status_code} - {e.response.text}")
-            if e.response.status_code == 429 and attempt < max_retries - 1:
-                retry_after = int(e.response.headers.get("Retry-After", 5))
-                await asyncio.sleep(retry_after)
-            else:
-                return False
-                
-        except Exception as e:
-            logger.error(f"Error updating Notion page: {str(e)}")
-            if attempt < max_retries - 1:
-                await asyncio.sleep(2 ** attempt)
-            else:
-                return False
+    try:
+        await _request("PATCH", url, orjson.dumps(data), "Updating Notion page", max_retries, timeout)
+    except NotionAPIError as e:
+        _log_http_error(e)
+        return False
+    except Exception as e:
+        logger.error(f"Error updating Notion page: {str(e)}")
+        return False
     
-    return False
+    logger.info(f"Successfully updated Notion page")
+    return True
+
+def _remember_script_url(properties: Dict[str, Any]) -> None:
+    """새로 생성한 페이지의 URL을 존재 여부 캐시에 기록해 재조회를 막습니다."""
+    video_url = properties.get("URL", {}).get("url")
+    if video_url:
+        _exists_cache[video_url] = (time.monotonic(), True)
 
 async def check_script_exists(video_url: str) -> bool:
     """스크립트 DB에 이미 해당 영상의 스크립트가 있는지 확인합니다."""
-    script_pages = await query_notion_database(SCRIPT_DB_ID)
+    cached = _exists_cache.get(video_url)
+    if cached is not None and time.monotonic() - cached[0] < _EXISTS_CACHE_TTL:
+        return cached[1]
     
-    for page in script_pages:
-        properties = page.get("properties", {})
-        url_property = properties.get("URL", {})
-        
-        if "url" in url_property and url_property["url"] == video_url:
-            return True
+    # URL 필터를 Notion 쪽에서 적용해 일치하는 페이지 하나만 가져옴
+    # 존재 여부만 필요하므로 속성 값은 제목(ID "title")만 받음
+    # 첫 페이지만 확인하고 이후 결과는 가져오지 않음
+    exists = False
+    try:
+        async for _ in iter_notion_database(SCRIPT_DB_ID, {
+            "filter": {
+                "property": "URL",
+                "url": {"equals": video_url}
+            },
+            "page_size": 1
+        }, filter_properties=["title"]):
+            exists = True
+            break
+    except Exception as e:
+        _log_query_error(SCRIPT_DB_ID, e)
+        return False
     
-    return False
+    # 존재하는 경우만 캐시: False는 곧 페이지 생성으로 이어지고,
+    # 생성 시 _remember_script_url이 True로 기록함
+    if exists:
+        _exists_cache[video_url] = (time.monotonic(), True)
+    return exists
+
+async def _reset_one(sem: asyncio.Semaphore, page_id: str, properties: Dict[str, Any]) -> bool:
+    """채널 페이지 하나를 활성화 상태로 변경합니다. 동시 요청 수는 세마포어로 제한합니다."""
+    async with sem:
+        return await update_notion_page(page_id, properties)
 
 async def reset_all_channels() -> bool:
     """참고용 DB의 모든 채널을 활성화 상태로 변경합니다."""
-    reference_pages = await query_notion_database(REFERENCE_DB_ID)
-    logger.info(f"Resetting {len(reference_pages)} channels to active state")
+    # 모든 페이지에 동일한 속성을 보내므로 한 번만 생성
+    properties = {"활성화": {"checkbox": True}}
     
-    success_count = 0
+    # Notion API 요청 제한을 고려해 동시 요청 수 제한
+    sem = asyncio.Semaphore(8)
     
-    for page in reference_pages:
-        page_id = page.get("id")
-        properties = {
-            "활성화": {
-                "checkbox": True
-            }
-        }
-        
-        success = await update_notion_page(page_id, properties)
-        if success:
-            success_count += 1
+    # 다음 쿼리 결과를 받는 동안에도 이미 받은 페이지의 업데이트를 진행
+    tasks = []
+    active_count = 0
+    query_failed = False
+    try:
+        async for page in iter_notion_database(REFERENCE_DB_ID):
+            # 이미 활성화된 채널은 요청 없이 건너뜀
+            if page.get("properties", {}).get("활성화", {}).get("checkbox") is True:
+                active_count += 1
+                continue
+            tasks.append(asyncio.create_task(_reset_one(sem, page["id"], properties)))
+    except Exception as e:
+        # 이미 시작한 업데이트는 마저 완료하되, 전체 초기화는 실패로 처리
+        _log_query_error(REFERENCE_DB_ID, e)
+        query_failed = True
+    logger.info(f"Resetting {len(tasks)} channels to active state ({active_count} already active)")
+    
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    success_count = sum(r is True for r in results)
+    
+    if tasks:
+        logger.info(f"Successfully reset {success_count}/{len(tasks)} channels")
     
-    logger.info(f"Successfully reset {success_count}/{len(reference_pages)} channels")
+    if query_failed:
+        return False
+    if not tasks:
+        return active_count > 0
     return success_count > 0
\ No newline at end of file